@@ -351,4 +351,8 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Statement parsing can use a process pool; frozen builds need this so
+    # worker processes don't re-run the launcher.
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
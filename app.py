@@ -31,7 +31,7 @@ import base64, subprocess, uuid, datetime as _dt
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 from cryptography.exceptions import InvalidSignature
 from tkinter import simpledialog as _sd
-from user_data import read_user_config, write_user_config, read_license_key, store_license_key
+from user_data import read_user_config, write_user_config, migrate_user_config, read_license_key, store_license_key
 
 # Platform detection for maximum optimization
 IS_WINDOWS = platform.system() == "Windows"
@@ -515,8 +515,9 @@ def import_statement(app: App):
 
     def _select_and_import():
         # Prevent crash on macOS by ensuring the dialog opens after the button click event is fully processed
-        filepath = filedialog.askopenfilename(
-            title="Pasirinkite banko išrašą",
+        # Several statements can be picked at once; they are parsed in parallel
+        filepaths = filedialog.askopenfilenames(
+            title="Pasirinkite banko išrašus",
             parent=app,
             filetypes=(
                 ("Visi palaikomi", "*.xlsx *.xls *.xml *.pdf"), 
@@ -526,18 +527,18 @@ def import_statement(app: App):
                 ("Visi failai", "*.*")
             )
         )
-        if not filepath: return
+        if not filepaths: return
 
         try:
             parser = BankStatementParser()
-            parsed_transactions = parser.parse(filepath)
+            parsed_transactions = [tx for txs in parser.parse_many(list(filepaths)) for tx in txs]
             existing_keys = FIREBASE_SYNC.get_transaction_keys()
             new_records_batch = {}
             new_count, db_duplicate_count, file_duplicate_count = 0, 0, 0
             keys_in_this_import = set()
 
             for tx in parsed_transactions:
-                tx_for_hash = {'date': tx['date'], 'payer': tx['payer'], 'details': tx['details'], 'amount': tx['amount']}
+                tx_for_hash = {'date': tx.date, 'payer': tx.payer, 'details': tx.details, 'amount': tx.amount}
                 fingerprint = _create_transaction_fingerprint(tx_for_hash)
 
                 if fingerprint in existing_keys or fingerprint in keys_in_this_import:
@@ -546,18 +547,18 @@ def import_statement(app: App):
                     continue
 
                 keys_in_this_import.add(fingerprint)
-                name, iban, comment = split_details(tx['payer'])
-                full_comment = f"{comment} | {tx['details']}".strip(" |") if tx['details'] else comment
+                name, iban, comment = split_details(tx.payer)
+                full_comment = f"{comment} | {tx.details}".strip(" |") if tx.details else comment
                 
                 # Use parsed IBAN if available, otherwise stick to split_details result
-                parsed_iban = tx.get('iban', '')
+                parsed_iban = tx.iban
                 final_iban = parsed_iban if parsed_iban else iban
 
                 new_records_batch[fingerprint] = {
-                    'key': fingerprint, 'date': tx['date'], 'price': _parse_price(tx['amount']),
+                    'key': fingerprint, 'date': tx.date, 'price': _parse_price(tx.amount),
                     'name': name, 'iban': final_iban, 'comment': full_comment,
                     'row_no': 0, 'name_norm': normalize(name),
-                    'date_obj': pd.to_datetime(tx['date'], errors='coerce').date().isoformat()
+                    'date_obj': pd.to_datetime(tx.date, errors='coerce').date().isoformat()
                 }
                 new_count += 1
 
@@ -790,7 +791,7 @@ def update_selection_style(app: App):
     
     if not keys:
         # Default Grey
-        app.style.map("Treeview", background=[('selected', '#808080')], foreground=[('selected', 'white')])
+        _apply_selection_colors(app, ColorConfig.SEL_DEFAULT, ColorConfig.SEL_FG_DEFAULT)
         return
 
     # Determine common status from SQLite
@@ -817,9 +818,14 @@ def update_selection_style(app: App):
             bg_color = ColorConfig.SEL_BOTH
             fg_color = ColorConfig.SEL_FG_DARK
             
+    _apply_selection_colors(app, bg_color, fg_color)
+    # The black focus ring is mapped once in App.__init__; it never varies
+
+def _apply_selection_colors(app: App, bg_color: str, fg_color: str):
+    # style.map restyles every Treeview, so only touch it when the colours change
+    if getattr(app, '_sel_colors', None) == (bg_color, fg_color): return
     app.style.map("Treeview", background=[('selected', bg_color)], foreground=[('selected', fg_color)])
-    # Enforce Black Focus Ring for all selections
-    app.style.map("Treeview", focuscolor=[('selected', ColorConfig.BORDER_FOCUS), ('!selected', 'white')])
+    app._sel_colors = (bg_color, fg_color)
 
 def on_select_change(app: App, event):
     update_selection_style(app)
@@ -888,6 +894,8 @@ def _guarded_main():
 def _main_inner():
     global DB_MANAGER, FIREBASE_SYNC
     
+    # Rename config keys left by older versions before anything reads them
+    migrate_user_config()
     allowed, msg = check_trial()
     if not allowed:
         root = tk.Tk(); root.withdraw()
@@ -950,8 +958,9 @@ def _main_inner():
     
     app.realtime_render_debouncer = OperationDebouncer(app, delay=300)
 
-    debouncer = OperationDebouncer(app, delay=FILTER_DEBOUNCE)
-    def _schedule_render(*_): debouncer.debounce('render', lambda: render(app))
+    # Shared with clear_filters() so resetting all three vars still renders once
+    app._render_debouncer = OperationDebouncer(app, delay=FILTER_DEBOUNCE)
+    def _schedule_render(*_): app._render_debouncer.debounce('render', lambda: render(app))
     app.var_q.trace_add('write', _schedule_render)
     app.var_from.trace_add('write', _schedule_render)
     app.var_to.trace_add('write', _schedule_render)
@@ -1052,6 +1061,8 @@ def _main_inner():
     def on_closing():
         try:
             app._is_closing = True
+            # Cancelling the afters below drops a pending note save, so write the notes out first
+            app._compact_note_store()
             for after_id in app.tk.call('after', 'info'): app.after_cancel(after_id)
             if FIREBASE_SYNC and FIREBASE_SYNC.is_connected(): FIREBASE_SYNC.stop_listener()
             app.quit(); app.destroy()
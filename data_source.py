@@ -223,7 +223,7 @@ def fetch_rows(cfg: dict) -> List[Tuple]:
     Fetch rows from configured data source (with caching for Sheets).
     """
     # CRITICAL: Define source at the VERY START
-    source = cfg.get("data_source", cfg.get("source", "file"))
+    source = cfg.get("data_source", "file")
     
     # Google Sheets with caching
     if source == "google_sheets" or source == "sheets":
@@ -270,7 +270,7 @@ def test_connection(cfg: dict) -> Tuple[int, Optional[str]]:
     Test the configured data source.
     Returns (row_count, error_message). Error is None on success.
     """
-    source = cfg.get("data_source", cfg.get("source", "file"))
+    source = cfg.get("data_source", "file")
     
     if source == "file":
         file_path = cfg.get("file_path")
@@ -298,7 +298,7 @@ def test_connection(cfg: dict) -> Tuple[int, Optional[str]]:
 
 def is_configured(cfg: dict) -> bool:
     """Check if a data source is properly configured."""
-    source = cfg.get("data_source", cfg.get("source", "file"))
+    source = cfg.get("data_source", "file")
     
     if source == "file":
         return bool(cfg.get("file_path"))
@@ -310,7 +310,7 @@ def is_configured(cfg: dict) -> bool:
 
 def get_source_description(cfg: dict) -> str:
     """Get a human-readable description of the data source."""
-    source = cfg.get("data_source", cfg.get("source", "file"))
+    source = cfg.get("data_source", "file")
     
     if source == "file":
         path = cfg.get("file_path", "")
@@ -5,7 +5,7 @@ Handles local storage of transactions, status, and notes with high performance.
 
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import time
 from user_data import user_data_dir
 
@@ -113,6 +113,21 @@ class DatabaseManager:
         self.conn.commit()
         print(f"✅ Bulk inserted {len(data)} transactions")
     
+    def bulk_insert_rows(self, rows: Iterable[Tuple]):
+        """
+        Insert transactions given as (key, date, price, name, iban, comment,
+        name_norm, row_no) tuples. Any iterable works - a generator is consumed
+        by executemany directly, with no per-row dict or intermediate list.
+        """
+        now = time.time()
+        cursor = self.conn.executemany("""
+            INSERT OR REPLACE INTO transactions 
+            (key, date, price, name, iban, comment, name_norm, row_no, archived, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+        """, (row + (now,) for row in rows))
+        self.conn.commit()
+        print(f"✅ Bulk inserted {cursor.rowcount} transactions")
+    
     def get_active_transactions(self, limit: Optional[int] = None) -> List[Dict]:
         """Get non-archived transactions, sorted by name and date."""
         query = """
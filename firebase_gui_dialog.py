@@ -17,8 +17,7 @@ class FirebaseSetupDialog(tk.Toplevel):
         self.geometry("500x400")
         self.resizable(False, False)
         
-        # Center on screen
-        self.update_idletasks()
+        # Center on screen (size is fixed, so no geometry flush is needed first)
         x = (self.winfo_screenwidth() // 2) - (250)
         y = (self.winfo_screenheight() // 2) - (200)
         self.geometry(f"500x400+{x}+{y}")
@@ -27,10 +26,12 @@ class FirebaseSetupDialog(tk.Toplevel):
         self.grab_set()
         
         self.completed = False
+        self._cfg = None  # user config, read once by _load_existing_config
         self._create_widgets()
         
-        # Load existing config if any
-        self._load_existing_config()
+        # Load existing config if any - after the dialog has painted, so the
+        # config file read doesn't delay the window appearing
+        self.after_idle(self._load_existing_config)
         
     def _create_widgets(self):
         """Create the dialog UI."""
@@ -103,16 +104,16 @@ class FirebaseSetupDialog(tk.Toplevel):
     def _load_existing_config(self):
         """Load and display existing Firebase config if present."""
         try:
-            cfg = read_user_config()
-            fb = cfg.get('firebase_config', {})
-            
-            if fb:
-                self.url_var.set(fb.get('database_url', ''))
-                self.project_var.set(fb.get('project_id', ''))
-                self.status_label.configure(text="✅ Firebase is currently configured",
-                                          fg='#28a745')
-        except:
-            pass
+            self._cfg = read_user_config()
+        except Exception:
+            return  # _save will read it again
+
+        fb = self._cfg.get('firebase_config') or {}
+        if fb:
+            self.url_var.set(fb.get('database_url', ''))
+            self.project_var.set(fb.get('project_id', ''))
+            self.status_label.configure(text="✅ Firebase is currently configured",
+                                      fg='#28a745')
     
     def _test_connection(self):
         """Test the Firebase connection."""
@@ -127,7 +128,9 @@ class FirebaseSetupDialog(tk.Toplevel):
         url = url.rstrip('/')
         
         self.status_label.configure(text="Testing connection...", fg='#666')
-        self.update()
+        # Repaint the label before the blocking test; update() would also run
+        # queued user events (e.g. a second click) re-entrantly
+        self.update_idletasks()
         
         try:
             from firebase_sync import FirebaseSync
@@ -178,12 +181,17 @@ class FirebaseSetupDialog(tk.Toplevel):
         url = url.rstrip('/')
         
         try:
-            cfg = read_user_config()
-            cfg['firebase_config'] = {
+            # Reuse the config read when the dialog opened (modal, so nothing
+            # else has changed it meanwhile)
+            cfg = self._cfg if self._cfg is not None else read_user_config()
+            fb = {
                 'database_url': url,
                 'project_id': project
             }
-            write_user_config(cfg)
+            # Only rewrite the config file when the settings actually changed
+            if cfg.get('firebase_config') != fb:
+                cfg['firebase_config'] = fb
+                write_user_config(cfg)
             
             self.completed = True
             
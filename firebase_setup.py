@@ -34,7 +34,7 @@ def show_current_status():
     try:
         cfg = read_user_config()
         print(f"\n📋 Current data source:")
-        source = cfg.get('data_source', cfg.get('source', 'not set'))
+        source = cfg.get('data_source', 'not set')
         print(f"   {source}")
         
         # Check Firebase config
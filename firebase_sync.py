@@ -13,9 +13,20 @@ import platform
 from pathlib import Path
 
 
+def _is_retryable(exc: Exception) -> bool:
+    """Network errors, timeouts, 408/429 and 5xx are transient; other HTTP errors are not."""
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status >= 500 or status in (408, 429)
+    return isinstance(exc, requests.exceptions.RequestException)
+
+
 class FirebaseSync:
     """Real-time sync manager for TrackNote using Firebase REST API."""
     
+    _MAX_WRITE_RETRIES = 8     # ~3 minutes of backoff before a batch is given up
+    _MAX_RETRY_DELAY = 60.0    # seconds
+    
     def __init__(self, database_url: str, project_id: str, namespace: str = "default"):
         """
         Initialize Firebase connection.
@@ -41,6 +52,10 @@ class FirebaseSync:
         self._write_thread = None
         self._write_running = False
         
+        # Failed note batches are retried with exponential backoff, then dropped
+        self._notes_retry_count = 0
+        self._notes_retry_at = 0.0
+        
         self._is_windows = platform.system() == "Windows"
         self._batch_interval = 0.5
         self._max_batch_size = 20 if self._is_windows else 10
@@ -95,12 +110,15 @@ class FirebaseSync:
                 time.sleep(self._batch_interval)
                 with self._lock:
                     status_writes = dict(self._pending_writes['status'])
-                    notes_writes = dict(self._pending_writes['notes'])
                     transaction_writes = dict(self._pending_writes['transactions'])
-                    
                     self._pending_writes['status'].clear()
-                    self._pending_writes['notes'].clear()
                     self._pending_writes['transactions'].clear()
+                    
+                    # While backing off after a failed notes batch, let notes accumulate
+                    notes_writes = {}
+                    if time.time() >= self._notes_retry_at:
+                        notes_writes = dict(self._pending_writes['notes'])
+                        self._pending_writes['notes'].clear()
 
                 if status_writes: self._batch_write_status(status_writes)
                 if notes_writes: self._batch_write_notes(notes_writes)
@@ -132,19 +150,40 @@ class FirebaseSync:
         """Write multiple note updates in one request."""
         try:
             url = f"{self.database_url}/tracknote/{self.namespace}/notes.json"
-            data, deletes = {}, []
+            data = {}
             for row_key, value in writes.items():
+                # A null child in a multi-path PATCH deletes it, so cleared notes
+                # ride along in the same request instead of one DELETE per row
                 if value is None or (isinstance(value, str) and not value.strip()):
-                    deletes.append(row_key)
+                    data[row_key] = None
                 else:
                     data[row_key] = {'text': value, 'updated_at': time.time()}
             
             if data: requests.patch(url, json=data, timeout=5).raise_for_status()
-            for row_key in deletes:
-                try: requests.delete(f"{self.database_url}/tracknote/{self.namespace}/notes/{row_key}.json", timeout=3)
-                except: pass
             self._connection_error_count = 0
-        except Exception: self._connection_error_count += 1
+            self._notes_retry_count = 0
+        except Exception as e:
+            self._connection_error_count += 1
+            if not _is_retryable(e):
+                # Auth revoked, rules reject the write, bad request...: retrying won't help
+                self._notes_retry_count = 0
+                print(f"⚠️ Firebase rejected {len(writes)} note update(s), not retrying: {e}")
+                return
+            self._notes_retry_count += 1
+            if self._notes_retry_count > self._MAX_WRITE_RETRIES:
+                self._notes_retry_count = 0
+                print(f"⚠️ Dropping {len(writes)} note update(s) after {self._MAX_WRITE_RETRIES} failed retries: {e}")
+                return
+            delay = min(self._MAX_RETRY_DELAY, self._batch_interval * 2 ** self._notes_retry_count)
+            self._notes_retry_at = time.time() + delay
+            self._requeue_writes('notes', writes)
+
+    def _requeue_writes(self, kind: str, writes: Dict):
+        """Put failed writes back for the next batch; anything queued since is newer and wins."""
+        with self._lock:
+            pending = self._pending_writes[kind]
+            for row_key, value in writes.items():
+                pending.setdefault(row_key, value)
 
     def _batch_write_transactions(self, writes: Dict):
         """Write multiple transaction updates in one request."""
@@ -2,9 +2,14 @@
 import re
 import unicodedata
 import pandas as pd
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from typing import List, Tuple, NamedTuple
+import io
 import os
+import sys
+import datetime as _dt
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import pairwise
 
 # Try importing pypdf, but don't crash if missing (though we added it to requirements)
 try:
@@ -13,11 +18,49 @@ try:
 except ImportError:
     PYPDF_AVAILABLE = False
 
+# Prefer lxml (libxml2) for XML statements; the stdlib ElementTree API is the fallback
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+    # ElementTree silently falls back to pure Python if its C accelerator is
+    # missing, which is many times slower - make that visible.
+    try:
+        import _elementtree
+        if ET.XMLParser is not _elementtree.XMLParser:
+            raise ImportError
+    except ImportError:
+        print("⚠ xml.etree C accelerator (_elementtree) is not in use; XML statements will parse slowly")
+
+# pyarrow is optional: with it, parsed Excel columns become packed Arrow
+# strings so the .str.* calls run in Arrow compute kernels.
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+_STRING_DTYPE = "string[pyarrow]" if PYARROW_AVAILABLE else "string"
+
+# python-calamine (Rust) reads .xlsx/.xls cells without openpyxl's XML parsing
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
 # --- ORIGINAL FUNCTIONS (REQUIRED BY APP.PY) ---
 
 # IBAN: LT + 16..20 digits (some rows may be short/mistyped), allow spaces
 IBAN_RE = re.compile(r"(?i)LT\s*\d(?:\s*\d){15,19}")
 
+# Payer names, IBAN fragments and detail strings repeat heavily within a
+# statement (recurring payers), so the pure str -> str helpers are memoized.
+_STR_CACHE_SIZE = 8192
+
+@lru_cache(maxsize=_STR_CACHE_SIZE)
 def _clean_iban(raw: str) -> str:
     # Keep 'LT' + digits, remove inner spaces
     raw = raw.strip()
@@ -27,12 +70,17 @@ def _clean_iban(raw: str) -> str:
     digits  = "".join(ch for ch in raw if ch.isdigit())
     return ("LT" if letters.upper().startswith("LT") else letters[:2].upper()) + digits
 
+@lru_cache(maxsize=_STR_CACHE_SIZE)
 def normalize(s: str) -> str:
     s = (s or "").lower()
+    if s.isascii():
+        # Nothing to decompose or strip; skip the NFD pass entirely
+        return " ".join(s.split())
     s = unicodedata.normalize("NFD", s)
     s = "".join(ch for ch in s if unicodedata.category(ch) != "Mn")
     return " ".join(s.split())
 
+@lru_cache(maxsize=_STR_CACHE_SIZE)
 def split_details(details_raw: str):
     """
     Robustly split 'Name ... LT######## ... Comment' into (name, iban, comment).
@@ -56,8 +104,60 @@ def split_details(details_raw: str):
         iban = ""
     return name, iban, comment
 
+def _find_iso_dates(text: str) -> List[Tuple[int, str]]:
+    """
+    Find YYYY-MM-DD dates that are not part of a longer digit run.
+    Same result as re.finditer(r'(?<!\d)(\d{4}-\d{2}-\d{2})(?!\d)', text),
+    but hops between '-' characters with str.find instead of running the
+    regex engine over every character of the stream.
+    Returns (start_index, date_str) tuples.
+    """
+    anchors = []
+    n = len(text)
+    i = text.find('-', 4)
+    while i != -1 and i + 6 <= n:
+        start = i - 4
+        if (text[i + 3] == '-'
+                and text[start:i].isdecimal()
+                and text[i + 1:i + 3].isdecimal()
+                and text[i + 4:i + 6].isdecimal()
+                and (start == 0 or not text[start - 1].isdecimal())
+                and (i + 6 == n or not text[i + 6].isdecimal())):
+            anchors.append((start, text[start:i + 6]))
+            i = text.find('-', i + 6)
+        else:
+            i = text.find('-', i + 1)
+    return anchors
+
 # --- NEW PROFESSIONAL PARSER CLASSES ---
 
+def _normalize_cell(cell):
+    """
+    Give a spreadsheet cell the same value whichever reader produced it:
+    date/datetime/Timestamp -> 'YYYY-MM-DD', integral float -> int,
+    other cells unchanged.
+    """
+    if isinstance(cell, _dt.datetime):  # includes pandas.Timestamp
+        return None if pd.isna(cell) else cell.date().isoformat()
+    if isinstance(cell, _dt.date):
+        return cell.isoformat()
+    if isinstance(cell, float) and cell.is_integer():
+        return int(cell)
+    return cell
+
+
+class Tx(NamedTuple):
+    """
+    One parsed statement transaction.
+    A fixed-layout tuple instead of a per-row dict: a statement can hold
+    thousands of these, and fields are read as attributes (tx.payer).
+    """
+    date: str
+    payer: str
+    details: str
+    amount: float
+    iban: str
+
 class StatementParsingError(Exception):
     """Base exception for parser errors."""
     pass
@@ -73,21 +173,24 @@ class ExcelBankStatementParser:
     """
     def __init__(self):
         self.COLUMN_MAP = {
+            'date': 'Data',
             'payer': 'Gavėjas/Mokėtojas',
             'details': 'Paaiškinimai',
             'amount': 'Apyvarta',
             'iban': 'Sąskaita' # Or 'Mokėtojo sąskaita' etc.
         }
+        # Potential IBAN columns, checked in order
+        self.IBAN_COLUMNS = ['Sąskaita', 'Mokėtojo sąskaita', 'IBAN']
 
-    def parse(self, filepath: str) -> List[Dict[str, Any]]:
+    def parse(self, filepath: str) -> List[Tx]:
         try:
-            df = pd.read_excel(filepath, header=None)
+            rows = self._read_raw_rows(filepath)
         except Exception as e:
             raise StatementParsingError(f"Could not read the Excel file: {e}")
 
         # Find header row
         header_row_index = -1
-        for i, row in df.iterrows():
+        for i, row in enumerate(rows):
             if any(str(cell).strip() == self.COLUMN_MAP['date'] for cell in row):
                 header_row_index = i
                 break
@@ -95,12 +198,11 @@ class ExcelBankStatementParser:
         if header_row_index == -1:
             raise StatementParsingError(f"Could not find the header row looking for '{self.COLUMN_MAP['date']}'.")
 
-        df.columns = df.iloc[header_row_index]
-        df = df.drop(range(header_row_index + 1))
-        df = df.reset_index(drop=True)
-        df.columns = df.columns.astype(str).str.strip()
+        header = [str(cell).strip() for cell in rows[header_row_index]]
+        df = pd.DataFrame(rows[header_row_index + 1:], columns=header)
 
         self._validate_columns(df)
+        df = self._to_string_columns(df)
 
         clean_transactions = []
         for _, row in df.iterrows():
@@ -112,14 +214,39 @@ class ExcelBankStatementParser:
         
         return clean_transactions
 
+    def _read_raw_rows(self, filepath: str) -> List[list]:
+        """Return the first sheet as a list of raw cell-value rows (no header handling)."""
+        if CALAMINE_AVAILABLE:
+            sheet = CalamineWorkbook.from_path(filepath).get_sheet_by_index(0)
+            rows = sheet.to_python()
+        else:
+            rows = pd.read_excel(filepath, header=None).values.tolist()
+        # The readers type cells differently: dates are date vs Timestamp (which
+        # str() renders with ' 00:00:00'), and calamine returns integral numbers
+        # as float ('304615435.0') where pandas/openpyxl gives int. Date, payer
+        # and details feed the import fingerprint, so both readers must come
+        # out with the same values.
+        return [[_normalize_cell(cell) for cell in row] for row in rows]
+
     def _validate_columns(self, df: pd.DataFrame):
         required_cols = self.COLUMN_MAP.values()
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
             raise MissingColumnsError(f"Missing required columns: {', '.join(missing_cols)}")
 
-    def _process_row(self, row: pd.Series) -> Dict[str, Any] | None:
-        amount_str = str(row.get(self.COLUMN_MAP['amount'], '')).strip()
+    def _to_string_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast the columns we read to a (preferably Arrow-backed) string dtype,
+        stripped and with missing cells as '', in one columnar pass each.
+        Rows can then use the values as-is instead of str(...).strip() per cell.
+        """
+        wanted = [*self.COLUMN_MAP.values(), *self.IBAN_COLUMNS]
+        for col in dict.fromkeys(c for c in wanted if c in df.columns):
+            df[col] = df[col].astype(_STRING_DTYPE).str.strip().fillna('')
+        return df
+
+    def _process_row(self, row: pd.Series) -> Tx | None:
+        amount_str = row.get(self.COLUMN_MAP['amount'], '')
         if not amount_str:
             return None
 
@@ -136,17 +263,16 @@ class ExcelBankStatementParser:
         if amount < 0:
              return None
 
-        date = str(row.get(self.COLUMN_MAP['date'], '')).strip()
-        payer = str(row.get(self.COLUMN_MAP['payer'], '')).strip()
-        details = str(row.get(self.COLUMN_MAP['details'], '')).strip()
+        date = row.get(self.COLUMN_MAP['date'], '')
+        payer = row.get(self.COLUMN_MAP['payer'], '')
+        details = row.get(self.COLUMN_MAP['details'], '')
         
         # Try to find IBAN
         iban = ""
         # Check potential IBAN columns
-        potential_iban_cols = ['Sąskaita', 'Mokėtojo sąskaita', 'IBAN']
-        for col in potential_iban_cols:
+        for col in self.IBAN_COLUMNS:
             if col in row.index:
-                val = str(row.get(col, '')).strip()
+                val = row.get(col, '')
                 if val and len(val) > 10: # Basic length check
                      iban = val
                      break
@@ -156,13 +282,13 @@ class ExcelBankStatementParser:
             
         # If payer is empty, try to use Details as payer? No, keep empty.
 
-        return {
-            'date': date,
-            'payer': payer,
-            'details': details,
-            'amount': amount,
-            'iban': iban
-        }
+        return Tx(
+            date=date,
+            payer=payer,
+            details=details,
+            amount=amount,
+            iban=iban
+        )
 
 class XMLBankStatementParser:
     """
@@ -171,46 +297,104 @@ class XMLBankStatementParser:
     def __init__(self):
         self.ns = {'ns': 'urn:iso:std:iso:20022:tech:xsd:camt.053.001.02'}
 
-    def parse(self, filepath: str) -> List[Dict[str, Any]]:
+        # Resolve every lookup path to Clark notation ('{uri}Tag') once, so the
+        # per-entry find() calls skip prefix expansion and hit ElementPath's
+        # compiled-path cache directly.
+        q = lambda path: path.replace('ns:', '{%s}' % self.ns['ns'])
+        self._ntry_tag = q('ns:Ntry')
+        self._p_date = q('ns:BookgDt/ns:Dt')
+        self._p_amt = q('ns:Amt')
+        self._p_cd = q('ns:CdtDbtInd')
+        self._p_tx_dtls = q('ns:NtryDtls/ns:TxDtls')
+        self._p_rltd = q('ns:RltdPties')
+        self._p_dbtr_nm = q('ns:Dbtr/ns:Nm')
+        self._p_dbtr_iban = q('ns:DbtrAcct/ns:Id/ns:IBAN')
+        self._p_rmt = q('ns:RmtInf')
+        self._p_ustrd = q('ns:Ustrd')
+        self._p_strd = q('ns:Strd')
+        self._p_cdtr_ref = q('ns:CdtrRefInf/ns:Ref')
+
+        # Under lxml, the remittance lookups that collect several nodes are
+        # compiled to XPath objects once; each call then runs in libxml2 and
+        # returns the text values directly instead of looping in Python.
+        if LXML_AVAILABLE:
+            self._x_ustrd = ET.XPath('ns:Ustrd/text()', namespaces=self.ns)
+            self._x_strd_ref = ET.XPath('ns:Strd/ns:CdtrRefInf/ns:Ref/text()', namespaces=self.ns)
+
+    def parse(self, filepath: str) -> List[Tx]:
+        entries = []
+        # Stream Ntry elements instead of building the whole document tree.
+        # Using the fixed namespace derived from the file provided is consistent;
+        # if nothing matches, the namespace is probably different.
+        ntry_count = 0
         try:
-            tree = ET.parse(filepath)
-            root = tree.getroot()
+            for ntry in self._iter_ntry(filepath):
+                ntry_count += 1
+                try:
+                    row = self._process_entry(ntry)
+                    if row:
+                        entries.append(row)
+                except Exception:
+                    continue
         except Exception as e:
             raise StatementParsingError(f"Could not parse XML file: {e}")
-
-        entries = []
-        # Find all Ntry elements. Handling potential namespace variations by stripping or using local-name() is safer, 
-        # but using the fixed namespace derived from the file provided is consistent.
-        # We'll use the namespace defined in __init__. 
-        # Robustness check: if findall returns nothing, maybe namespace is different.
-        
-        ntry_elements = root.findall('.//ns:Ntry', self.ns)
-        if not ntry_elements:
-            # Try without namespace or wildcards if needed, but let's stick to the providing standard for now.
-            pass
-
-        for ntry in ntry_elements:
-            try:
-                row = self._process_entry(ntry)
-                if row:
-                    entries.append(row)
-            except Exception:
-                continue
                 
-        if not entries and not ntry_elements:
+        if not entries and not ntry_count:
              raise StatementParsingError("No entries found in XML. Namespace might be mismatched.")
              
         return entries
 
-    def _process_entry(self, ntry) -> Dict[str, Any]:
+    def parse_bytes(self, data: bytes) -> List[Tx]:
+        """
+        Parse a statement already held in memory (e.g. a test fixture), without
+        a round-trip through the filesystem. iterparse reads file objects just
+        like paths, so this streams the same way parse() does.
+        """
+        return self.parse(io.BytesIO(data))
+
+    def _iter_ntry(self, source):
+        """
+        Yield each Ntry element as soon as it is fully parsed, then free it, so
+        memory stays flat regardless of statement size.
+        """
+        if LXML_AVAILABLE:
+            context = ET.iterparse(source, events=('end',), tag=self._ntry_tag, huge_tree=False)
+        else:
+            context = ET.iterparse(source, events=('end',))
+
+        for _, elem in context:
+            if elem.tag != self._ntry_tag:
+                continue
+            yield elem
+            elem.clear()
+            if LXML_AVAILABLE:
+                # Also drop the already-processed siblings still held by the parent
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+    def _process_entry(self, ntry) -> Tx | None:
+        # Credit/Debit Indicator first: it is the cheapest check and rejects
+        # every outgoing entry before any other lookup or float() parsing
+        cd_el = ntry.find(self._p_cd)
+        if cd_el is None:
+            return None
+        
+        indicator = cd_el.text
+        if indicator:
+            indicator = indicator.upper()
+        
+        # FILTER: Only keep incoming (Credit) transactions
+        if indicator == 'DBIT':
+            return None
+
         # Booking Date
-        date_el = ntry.find('ns:BookgDt/ns:Dt', self.ns)
+        date_el = ntry.find(self._p_date)
         if date_el is None:
             return None
         date = date_el.text
 
         # Amount
-        amount_el = ntry.find('ns:Amt', self.ns)
+        amount_el = ntry.find(self._p_amt)
         if amount_el is None:
             return None
         try:
@@ -219,24 +403,11 @@ class XMLBankStatementParser:
             val = float(amount_el.text)
         except (ValueError, TypeError):
             return None
-
-        # Credit/Debit Indicator
-        cd_el = ntry.find('ns:CdtDbtInd', self.ns)
-        if cd_el is None:
-            return None
-        
-        indicator = cd_el.text
-        if indicator:
-            indicator = indicator.upper()
-        
-        # FILTER: Only keep incoming (Credit) transactions
-        if indicator == 'DBIT':
-            return None
         
         amount = abs(val)
 
         # Transaction Details - Payer/Payee
-        tx_dtls = ntry.find('ns:NtryDtls/ns:TxDtls', self.ns)
+        tx_dtls = ntry.find(self._p_tx_dtls)
         payer = ""
         details = ""
 
@@ -244,43 +415,45 @@ class XMLBankStatementParser:
 
         if tx_dtls is not None:
             # Related Parties
-            rltd = tx_dtls.find('ns:RltdPties', self.ns)
+            rltd = tx_dtls.find(self._p_rltd)
             if rltd is not None:
                 # With DBIT filtered out, we are only handling CRDT (Income)
                 # We want the Debtor (Sender)
-                node = rltd.find('ns:Dbtr/ns:Nm', self.ns)
+                node = rltd.find(self._p_dbtr_nm)
                 
                 if node is not None:
                     payer = node.text
                 
                 # Try to extract IBAN from structured node first
-                iban_node = rltd.find('ns:DbtrAcct/ns:Id/ns:IBAN', self.ns)
+                iban_node = rltd.find(self._p_dbtr_iban)
                 if iban_node is not None:
                      iban = iban_node.text
             
             # Remittance Info - Join ALL Ustrd tags
-            rmt = tx_dtls.find('ns:RmtInf', self.ns)
+            rmt = tx_dtls.find(self._p_rmt)
             if rmt is not None:
-                ustrd_nodes = rmt.findall('ns:Ustrd', self.ns)
-                if ustrd_nodes:
-                    details = " ".join([node.text for node in ustrd_nodes if node.text])
-                
-                # Also check Strd (Structured) for Ref
-                if not details: # Or append to it? Let's check Strd as well.
-                    strd_nodes = rmt.findall('ns:Strd', self.ns)
-                    refs = []
-                    for strd in strd_nodes:
-                        # Extract Creditor Reference Information
-                        cdtr_ref = strd.find('ns:CdtrRefInf/ns:Ref', self.ns)
-                        if cdtr_ref is not None and cdtr_ref.text:
-                            refs.append(cdtr_ref.text)
-                    
-                    if refs:
-                        details_part = " ".join(refs)
-                        if details:
-                            details += " " + details_part
-                        else:
-                            details = details_part
+                if LXML_AVAILABLE:
+                    details = " ".join(self._x_ustrd(rmt))
+                    # Creditor Reference Information of every Strd block
+                    refs = self._x_strd_ref(rmt) if not details else []
+                else:
+                    # One pass over RmtInf's children picks up both the Ustrd
+                    # lines and each Strd block's Creditor Reference, instead
+                    # of a separate findall() per tag
+                    ustrd_texts, refs = [], []
+                    for child in rmt:
+                        if child.tag == self._p_ustrd:
+                            if child.text:
+                                ustrd_texts.append(child.text)
+                        elif child.tag == self._p_strd:
+                            cdtr_ref = child.find(self._p_cdtr_ref)
+                            if cdtr_ref is not None and cdtr_ref.text:
+                                refs.append(cdtr_ref.text)
+                    details = " ".join(ustrd_texts)
+
+                # Structured (Strd) references fill in when there is no Ustrd text
+                if not details and refs:
+                    details = " ".join(refs)
 
         # Fallback: If IBAN is missing, try to find it in the details
         if not iban and details:
@@ -289,76 +462,102 @@ class XMLBankStatementParser:
              if found_iban:
                  iban = found_iban
 
-        return {
-            'date': date,
-            'payer': payer or "Unknown",
-            'details': details,
-            'amount': amount,
-            'iban': iban
-        }
+        # Recurring payers repeat the same name/IBAN many times per statement;
+        # interning lets all those rows share one string object.
+        return Tx(
+            date=date,
+            payer=sys.intern(payer or "Unknown"),
+            details=details,
+            amount=amount,
+            iban=sys.intern(iban) if iban else iban
+        )
+
+# Below this many date blocks, SmartPDFParser parses in-process
+_PDF_PARALLEL_MIN_BLOCKS = 2000
+
+# Whitespace variants found in extracted PDF text, mapped to a plain space
+_WS_TABLE = str.maketrans({'\t': ' ', '\xa0': ' ', '\u2007': ' ', '\u202f': ' '})
 
 class SmartPDFParser:
     """
     Robust Stream-Based Parser.
     Instead of line-by-line, it treats text as a stream and segments by Date.
     """
-    def parse(self, filepath: str) -> List[Dict[str, Any]]:
+    # Compiled once per process rather than looked up per block.
+    # Amount: (Sign)(Integer part)[.,](Decimal part), not glued to other numbers
+    _RE_AMOUNT = re.compile(r'(?<![\d.,])([+−-]?)(\d[\d\s]*)[.,](\d{2})(?![\d.,])')
+    _RE_IBAN = IBAN_RE
+
+    def parse(self, filepath: str) -> List[Tx]:
         if not PYPDF_AVAILABLE:
             raise StatementParsingError("pypdf library is not installed.")
 
         try:
-            reader = PdfReader(filepath)
-            full_text = []
-            for page in reader.pages:
-                text = page.extract_text()
+            # Pages are separated by newlines: they are useful delimiters.
+            # Writing into one buffer avoids holding a list of every page's
+            # text alongside the joined copy at the end.
+            buf = io.StringIO()
+            for text in self._iter_page_texts(filepath):
                 if text:
-                    full_text.append(text)
-            
-            # Join with spaces to handle wrapping, but keep some structure if possible?
-            # Actually, newlines are useful delimiters. Let's keep them but maybe clean up later.
-            full_stream = "\n".join(full_text)
+                    if buf.tell():
+                        buf.write("\n")
+                    buf.write(text)
+            # Fold tabs and the non-breaking/figure spaces PDF extractors emit
+            # into plain spaces in one C-level pass over the whole stream.
+            full_stream = buf.getvalue().translate(_WS_TABLE)
         except Exception as e:
             raise StatementParsingError(f"Could not read PDF: {e}")
 
-        clean_transactions = []
-        
         # 1. Find all Date Anchors (YYYY-MM-DD)
         # We assume transactions start with a date.
-        date_iter = re.finditer(r'(?<!\d)(\d{4}-\d{2}-\d{2})(?!\d)', full_stream)
-        
         # Store (start_index, date_str) tuples
-        anchors = []
-        for m in date_iter:
-            anchors.append((m.start(), m.group(1)))
+        anchors = _find_iso_dates(full_stream)
             
         if not anchors:
             raise StatementParsingError("No dates found in PDF. Unknown format.")
             
         # 2. Process blocks between anchors
-        for i in range(len(anchors)):
-            start_idx, date_str = anchors[i]
-            
-            # End index is the start of the next date, or end of string
-            if i < len(anchors) - 1:
-                end_idx = anchors[i+1][0]
-            else:
-                end_idx = len(full_stream)
-            
-            # Extract raw block text
-            raw_block = full_stream[start_idx:end_idx]
-            
-            # Remove the date itself from the start (it matches date_str)
-            # The regex matched at start_idx, so `date_str` is at the beginning.
-            # We skip its length.
-            block_content = raw_block[len(date_str):].strip()
-            
+        # A sentinel at end-of-stream lets each block pair with the next anchor
+        # (or the end of the string) without an index/branch per iteration.
+        # Each block's text is taken after the date itself: `date_str` starts
+        # at start_idx, so we skip its length directly in a single slice.
+        bounds = [*anchors, (len(full_stream), '')]
+        blocks = [
+            (date_str, full_stream[start_idx + len(date_str):end_idx].strip())
+            for (start_idx, date_str), (end_idx, _) in pairwise(bounds)
+        ]
+
+        # 3. Parse the blocks. They are independent of each other, so very long
+        # statements are split across worker processes (by block, not by page:
+        # a transaction can continue over a page break). Typical statements
+        # stay in-process, where pool start-up would cost more than it saves.
+        if len(blocks) >= _PDF_PARALLEL_MIN_BLOCKS and (os.cpu_count() or 1) > 1:
+            workers = os.cpu_count()
+            size = -(-len(blocks) // workers)  # ceil division
+            chunks = [blocks[i:i + size] for i in range(0, len(blocks), size)]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as ex:
+                return [tx for part in ex.map(_parse_pdf_blocks, chunks) for tx in part]
+
+        clean_transactions = []
+        for date_str, block_content in blocks:
             parsed_tx = self._parse_block(date_str, block_content)
             if parsed_tx:
                 clean_transactions.append(parsed_tx)
                 
         return clean_transactions
 
-    def _parse_block(self, date_str: str, text: str) -> Dict[str, Any] | None:
+    def _iter_page_texts(self, filepath: str):
+        """
+        Yield the extracted text of each page.
+        Always pypdf (pinned in requirements.txt): other extractors space the
+        same glyphs differently ("RK0.00" vs "RK 0.00"), and `details` feeds the
+        import fingerprint, so a second extractor would re-import duplicates.
+        """
+        reader = PdfReader(filepath)
+        for page in reader.pages:
+            yield page.extract_text()
+
+    def _parse_block(self, date_str: str, text: str) -> Tx | None:
         """
         Extracts Amount, Name, IBAN, Details from a text block.
         """
@@ -369,19 +568,22 @@ class SmartPDFParser:
         # But flexible about spaces between sign and number: `+ 98.00` (unlikely but possible)
         # or `98 .00` (bad OCR). Let's stick to standard `[-+]?\d+[.,]\d{2}`.
         
-        # Capture: (Sign)(Integer part)(Separator)(Decimal part)
-        amt_pattern = re.compile(r'(?<![\d.,])([+−-]?)(\d[\d\s]*)[.,](\d{2})(?![\d.,])')
-        
+        # Capture: (Sign)(Integer part)(Separator)(Decimal part) - see _RE_AMOUNT
         # We take the *first* match as the transaction amount.
-        m_amt = amt_pattern.search(text)
+        m_amt = self._RE_AMOUNT.search(text)
         if not m_amt:
             return None # No amount found -> maybe not a transaction row?
 
         # Parse Amount
         sign, integer_part, decimal_part = m_amt.groups()
+
+        # Skip outgoing on the captured sign alone, before any string
+        # cleanup or float() conversion (most business rows are debits)
+        if sign and sign != '+':
+            return None
         
-        # Clean integer part (remove spaces)
-        integer_part = integer_part.replace(' ', '').replace('\xa0', '')
+        # Clean integer part (remove spaces; NBSPs were already folded by _WS_TABLE)
+        integer_part = integer_part.replace(' ', '')
         
         # Reconstruct valid float string
         raw_float_str = f"{sign}{integer_part}.{decimal_part}".replace('−', '-')
@@ -396,7 +598,7 @@ class SmartPDFParser:
         # 2. Extract IBAN
         # IBAN regex (LT...)
         # We use the global IBAN_RE or a local one.
-        m_iban = IBAN_RE.search(text)
+        m_iban = self._RE_IBAN.search(text)
         iban = ""
         if m_iban:
             iban = _clean_iban(m_iban.group(0))
@@ -482,23 +684,27 @@ class SmartPDFParser:
             full_str = " ".join(clean_rem)
             final_name, final_iban_dummy, final_comment = split_details(full_str)
             
-        return {
-            'date': date_str,
-            'payer': final_name if final_name else "Statement Entry",
-            'details': final_comment,
-            'amount': amount,
-            'iban': iban
-        }
+        # Share one string object per distinct payer/IBAN (recurring customers)
+        return Tx(
+            date=date_str,
+            payer=sys.intern(final_name if final_name else "Statement Entry"),
+            details=final_comment,
+            amount=amount,
+            iban=sys.intern(iban)
+        )
 
 # Alias the new class to the old name so we don't break the Factory 
 # (Or we could update the Factory, but this is cleaner diff-wise)
 PDFBankStatementParser = SmartPDFParser
 
+# Merchant terminal payouts/settlements: "PREKYB. ID" and "TERM. SK." in any order
+_IGNORE_RE = re.compile(r'PREKYB\. ID.*TERM\. SK\.|TERM\. SK\..*PREKYB\. ID', re.IGNORECASE | re.DOTALL)
+
 class BankStatementParser:
     """
     Facade class that delegates to the appropriate parser based on file extension.
     """
-    def parse(self, filepath: str) -> List[Dict[str, Any]]:
+    def parse(self, filepath: str) -> List[Tx]:
         ext = os.path.splitext(filepath)[1].lower()
         
         if ext in ('.xlsx', '.xls'):
@@ -513,22 +719,38 @@ class BankStatementParser:
         # Filter out irrelevant transactions
         return [t for t in transactions if not self.should_ignore_transaction(t)]
 
-    def should_ignore_transaction(self, transaction: Dict[str, Any]) -> bool:
+    def parse_many(self, filepaths: List[str]) -> List[List[Tx]]:
+        """
+        Parse several statements in parallel, one worker process per file.
+        Results are returned in the same order as `filepaths`.
+        """
+        if len(filepaths) < 2:
+            return [self.parse(fp) for fp in filepaths]
+
+        workers = min(len(filepaths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_parse_statement_file, filepaths))
+
+    def should_ignore_transaction(self, transaction: Tx) -> bool:
         """
         Check if transaction should be ignored based on details.
         Filters out merchant terminal payouts/settlements.
         """
-        details = transaction.get('details', '')
+        details = transaction.details
         if not details:
             return False
             
         # Check for the specific pattern mentioned by user:
         # "Swedbank IMONE... PREKYB. ID... TERM. SK...."
         # We'll check for the co-existence of "PREKYB. ID" and "TERM. SK."
-        # using a case-insensitive check to be safe, although the example was uppercase.
-        
-        details_upper = details.upper()
-        if "PREKYB. ID" in details_upper and "TERM. SK." in details_upper:
-            return True
-            
-        return False
\ No newline at end of file
+        # (in either order) with one case-insensitive scan, although the example was uppercase.
+        return _IGNORE_RE.search(details) is not None
+
+def _parse_statement_file(filepath: str) -> List[Tx]:
+    """Process-pool worker for BankStatementParser.parse_many (top-level so it pickles)."""
+    return BankStatementParser().parse(filepath)
+
+def _parse_pdf_blocks(blocks: List[Tuple[str, str]]) -> List[Tx]:
+    """Process-pool worker for SmartPDFParser.parse: (date_str, text) blocks -> Tx list."""
+    parser = SmartPDFParser()
+    return [tx for tx in (parser._parse_block(d, text) for d, text in blocks) if tx]
@@ -1,4 +1,5 @@
 
+import os
 import unittest
 import parsing
 from parsing import SmartPDFParser
@@ -33,9 +34,10 @@ class TestParsingIssues(unittest.TestCase):
         parsing.PdfReader = lambda f: MockPdfReader([raw_text])
         txs = self.parser.parse("dummy.pdf")
         
-        print("\n--- Advanced Parsing Results ---")
-        for i, t in enumerate(txs):
-            print(f"[{i}] Name: '{t['payer']}' | Details: '{t['details']}'")
+        if os.environ.get('VERBOSE'):
+            print("\n--- Advanced Parsing Results ---")
+            for i, t in enumerate(txs):
+                print(f"[{i}] Name: '{t.payer}' | Details: '{t.details}'")
 
         # Expectation: Names should be captured as payer, not details
         # For Case 1 (Name after IBAN), current logic might put it in Details
@@ -1,3 +1,4 @@
+import os
 import re
 import unittest
 from parsing import SmartPDFParser
@@ -48,27 +49,28 @@ class TestSmartPDFParser(unittest.TestCase):
         
         txs = self.parser.parse("dummy.pdf")
         
-        print("\nParsed Transactions:")
-        for t in txs:
-            print(t)
+        if os.environ.get('VERBOSE'):
+            print("\nParsed Transactions:")
+            for t in txs:
+                print(t)
             
         self.assertEqual(len(txs), 2, "Should parse 2 incoming transactions (skipped 1 outgoing)")
         
         # Check Tx 1
         t1 = txs[0]
-        self.assertEqual(t1['date'], '2025-11-13')
-        self.assertEqual(t1['amount'], 98.00)
-        self.assertEqual(t1['iban'], 'LT237044060007980165')
-        self.assertIn('ALEŠKEVIČIENĖ GRETA', t1['payer'])
-        self.assertIn('užsak.nr3279', t1['details'])
+        self.assertEqual(t1.date, '2025-11-13')
+        self.assertEqual(t1.amount, 98.00)
+        self.assertEqual(t1.iban, 'LT237044060007980165')
+        self.assertIn('ALEŠKEVIČIENĖ GRETA', t1.payer)
+        self.assertIn('užsak.nr3279', t1.details)
         
         # Check Tx 2
         t2 = txs[1]
-        self.assertEqual(t2['date'], '2025-11-14')
-        self.assertEqual(t2['amount'], 78.00)
-        self.assertEqual(t2['iban'], 'LT227300010138198179')
-        self.assertIn('AUŠRA SEREIKIENĖ', t2['payer'])
-        self.assertIn('Aušra Ausryte', t2['details'])
+        self.assertEqual(t2.date, '2025-11-14')
+        self.assertEqual(t2.amount, 78.00)
+        self.assertEqual(t2.iban, 'LT227300010138198179')
+        self.assertIn('AUŠRA SEREIKIENĖ', t2.payer)
+        self.assertIn('Aušra Ausryte', t2.details)
 
 if __name__ == "__main__":
     unittest.main()
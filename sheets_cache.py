@@ -2,14 +2,64 @@
 Google Sheets caching to reduce load times and API quota usage.
 """
 
-import json
+import hashlib
+import os
+import pickle
 import time
+from functools import lru_cache
 from pathlib import Path
 from user_data import user_data_dir
 
+# Compress the cached rows with zstd when available; tabular sheet text
+# shrinks several-fold, so the cache costs far less disk bandwidth to load
+try:
+    import zstandard as zstd
+    _CCTX = zstd.ZstdCompressor(level=3)
+    _DCTX = zstd.ZstdDecompressor()
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 # Cache configuration
 CACHE_DURATION = 300  # 5 minutes (300 seconds)
-CACHE_FILE = user_data_dir() / "sheets_cache.json"
+# Stored as a binary pickle. Older versions wrote JSON to sheets_cache.json;
+# that file is left alone (it is only a 5-minute cache), so a downgraded
+# version never tries to parse a pickle as JSON.
+CACHE_FILE = user_data_dir() / "sheets_cache.pkl"
+
+# (digest of sheet/tab/rows, file mtime_ns) of the last write by this
+# process, to skip rewriting an identical payload on every refresh
+_LAST_HASH = None
+
+
+def _read_cache_file(path: Path, with_rows: bool = True) -> dict:
+    """
+    Load the cache dict.
+    The file stores the small metadata dict first and the rows as a
+    second pickle after it (column-wise and/or zstd-compressed when the
+    metadata says so), so with_rows=False stops before reading any row.
+    """
+    with path.open('rb') as f:
+        cache_data = pickle.load(f)
+        if with_rows:
+            if cache_data.get('codec') == 'zstd':
+                payload = pickle.loads(_DCTX.decompress(f.read()))
+            else:
+                payload = pickle.load(f)
+            if cache_data.get('layout') == 'columns':
+                payload = list(zip(*payload))  # back to row tuples
+            cache_data['rows'] = payload
+        return cache_data
+
+
+@lru_cache(maxsize=4)
+def _load_cache(path_str: str, mtime_ns: int, with_rows: bool = True) -> dict:
+    """
+    In-process memo of the decoded cache file. Keyed by mtime, so repeated
+    reads within a session (refresh, tab switches) skip disk I/O entirely
+    until the file is rewritten. Treat the result as read-only.
+    """
+    return _read_cache_file(Path(path_str), with_rows)
 
 
 def get_cached_sheets(spreadsheet_id: str, tab_name: str):
@@ -24,11 +74,21 @@ def get_cached_sheets(spreadsheet_id: str, tab_name: str):
         List of rows if cache is fresh, None otherwise
     """
     try:
-        if not CACHE_FILE.exists():
+        # One stat() tells us both whether there is a cache and whether it is
+        # still fresh (within 5 minutes) - a stale file is never opened.
+        # The mtime is the time of the last save, or of the last refresh
+        # that found the rows unchanged (see save_sheets_cache).
+        try:
+            st = CACHE_FILE.stat()
+        except FileNotFoundError:
             return None
+        age_seconds = time.time() - st.st_mtime
+        if age_seconds > CACHE_DURATION:
+            return None  # Cache expired
         
-        # Load cache file
-        cache_data = json.loads(CACHE_FILE.read_text())
+        # Load just the metadata first (memoized until it changes on disk);
+        # rows are only decoded once we know they will be used
+        cache_data = _load_cache(str(CACHE_FILE), st.st_mtime_ns, False)
         
         # Check if cache matches this sheet
         if cache_data.get('spreadsheet_id') != spreadsheet_id:
@@ -36,15 +96,10 @@ def get_cached_sheets(spreadsheet_id: str, tab_name: str):
         if cache_data.get('tab_name') != tab_name:
             return None
         
-        # Check if cache is still fresh (within 5 minutes)
-        cached_time = cache_data.get('timestamp', 0)
-        age_seconds = time.time() - cached_time
-        
-        if age_seconds > CACHE_DURATION:
-            return None  # Cache expired
-        
-        # Cache is fresh - return the data
-        rows = cache_data.get('rows', [])
+        # Cache is fresh - return a copy of the data, so callers can't alter
+        # the memoized list
+        cache_data = _load_cache(str(CACHE_FILE), st.st_mtime_ns)
+        rows = list(cache_data.get('rows', []))
         print(f"✓ Using cached Sheets data (age: {int(age_seconds)}s)")
         return rows
     
@@ -63,21 +118,56 @@ def save_sheets_cache(spreadsheet_id: str, tab_name: str, rows: list):
         tab_name: Tab/worksheet name
         rows: List of row tuples to cache
     """
+    global _LAST_HASH
     try:
         # Ensure cache directory exists
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         
-        # Prepare cache data
+        # Rectangular rows (the usual (row_no, date, price, details) tuples)
+        # are stored column by column: each column holds one kind of value,
+        # so it pickles smaller, compresses better and unpickles faster
+        columnar = bool(rows) and len({len(r) for r in rows}) == 1
+        rows_blob = pickle.dumps(list(zip(*rows)) if columnar else rows, protocol=5)
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{spreadsheet_id}\0{tab_name}\0".encode("utf-8"))
+        h.update(rows_blob)
+        digest = h.digest()
+        
+        try:
+            on_disk = (digest, CACHE_FILE.stat().st_mtime_ns)
+        except FileNotFoundError:
+            on_disk = None
+        if on_disk is not None and on_disk == _LAST_HASH:
+            # Same sheet and rows as the file we last wrote, and nobody has
+            # touched it since: just mark it fresh again instead of rewriting
+            os.utime(CACHE_FILE)
+            _LAST_HASH = (digest, CACHE_FILE.stat().st_mtime_ns)
+            print(f"✓ Sheets data unchanged ({len(rows)} rows), cache refreshed")
+            return
+        
+        # Prepare cache metadata (the rows are written after it, see
+        # _read_cache_file)
         cache_data = {
             'spreadsheet_id': spreadsheet_id,
             'tab_name': tab_name,
             'timestamp': time.time(),
-            'rows': rows,
             'row_count': len(rows)
         }
+        if columnar:
+            cache_data['layout'] = 'columns'
+        if ZSTD_AVAILABLE:
+            cache_data['codec'] = 'zstd'
+            rows_blob = _CCTX.compress(rows_blob)
         
-        # Write to file
-        CACHE_FILE.write_text(json.dumps(cache_data, ensure_ascii=False, indent=2))
+        # Write to a temp file and swap it in, so a crash mid-write never
+        # leaves a truncated cache behind
+        tmp = CACHE_FILE.with_suffix('.tmp')
+        with tmp.open('wb') as f:
+            pickle.dump(cache_data, f, protocol=5)
+            f.write(rows_blob)  # second (possibly compressed) pickle in the stream
+        os.replace(tmp, CACHE_FILE)
+        _load_cache.cache_clear()
+        _LAST_HASH = (digest, CACHE_FILE.stat().st_mtime_ns)
         print(f"✓ Cached {len(rows)} rows from Sheets")
         
     except Exception as e:
@@ -87,7 +177,10 @@ def save_sheets_cache(spreadsheet_id: str, tab_name: str, rows: list):
 
 def clear_cache():
     """Clear the Sheets cache file."""
+    global _LAST_HASH
     try:
+        _load_cache.cache_clear()
+        _LAST_HASH = None
         if CACHE_FILE.exists():
             CACHE_FILE.unlink()
             print("✓ Sheets cache cleared")
@@ -108,23 +201,34 @@ def get_cache_info():
         Dict with cache info, or None if no cache exists
     """
     try:
-        if not CACHE_FILE.exists():
+        # Freshness comes from a single stat() of the file, like
+        # get_cached_sheets
+        try:
+            st = CACHE_FILE.stat()
+        except FileNotFoundError:
             return None
-        
-        cache_data = json.loads(CACHE_FILE.read_text())
-        
-        timestamp = cache_data.get('timestamp', 0)
-        age_seconds = time.time() - timestamp
-        is_fresh = age_seconds <= CACHE_DURATION
-        
-        return {
-            'spreadsheet_id': cache_data.get('spreadsheet_id', 'unknown'),
-            'tab_name': cache_data.get('tab_name', 'unknown'),
-            'row_count': cache_data.get('row_count', 0),
-            'age_seconds': int(age_seconds),
-            'age_minutes': round(age_seconds / 60, 1),
-            'is_fresh': is_fresh,
-            'expires_in': max(0, CACHE_DURATION - age_seconds) if is_fresh else 0
-        }
+        # Status bars poll this on a timer; within the same second and the
+        # same file version the answer cannot change, so it is reused
+        info = _cache_info(str(CACHE_FILE), st.st_mtime_ns, int(time.time()))
+        return dict(info)
     except Exception:
-        return None
\ No newline at end of file
+        return None
+
+
+@lru_cache(maxsize=1)
+def _cache_info(path_str: str, mtime_ns: int, now_s: int) -> dict:
+    age_seconds = max(0, now_s - mtime_ns / 1e9)
+    is_fresh = age_seconds <= CACHE_DURATION
+    
+    # Only the small metadata header is decoded, never the rows
+    cache_data = _load_cache(path_str, mtime_ns, False)
+    
+    return {
+        'spreadsheet_id': cache_data.get('spreadsheet_id', 'unknown'),
+        'tab_name': cache_data.get('tab_name', 'unknown'),
+        'row_count': cache_data.get('row_count', 0),
+        'age_seconds': int(age_seconds),
+        'age_minutes': round(age_seconds / 60, 1),
+        'is_fresh': is_fresh,
+        'expires_in': max(0, CACHE_DURATION - age_seconds) if is_fresh else 0
+    }
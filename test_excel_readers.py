@@ -0,0 +1,62 @@
+"""
+The Excel parser reads sheets with python-calamine when it is installed and
+with pandas.read_excel otherwise. Both readers must yield the same transactions:
+Tx.date and Tx.details feed the import fingerprint, so a reader-dependent
+difference would re-import a statement as duplicates on another machine.
+"""
+import datetime
+import os
+import tempfile
+import unittest
+
+try:
+    import pandas  # noqa: F401
+    import openpyxl
+    import python_calamine  # noqa: F401
+    READERS_AVAILABLE = True
+except ImportError:
+    READERS_AVAILABLE = False
+
+
+def _write_statement(path):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Sąskaitos išrašas"])  # title row above the table
+    ws.append(["Data", "Gavėjas/Mokėtojas", "Paaiškinimai", "Apyvarta", "Sąskaita"])
+    ws.append([datetime.datetime(2025, 11, 3), "JONAS JONAITIS", "užsak.nr3279", 98.5, "LT237044060007980165"])
+    ws.append([datetime.datetime(2025, 11, 4), "AUŠRA SEREIKIENĖ", "Aušra Ausryte", "+78,00", "LT227300010138198179"])
+    # Numeric payer/details cells: calamine reads them as float, openpyxl as int
+    ws.append([datetime.datetime(2025, 11, 4), 304615435, 3279, 12, "LT227300010138198179"])
+    ws.append([datetime.date(2025, 11, 5), "OUTGOING", "", -10.0, ""])
+    wb.save(path)
+
+
+@unittest.skipUnless(READERS_AVAILABLE, "pandas, openpyxl and python-calamine are required")
+class TestExcelReadersAgree(unittest.TestCase):
+    def setUp(self):
+        import parsing
+        self.parsing = parsing
+        self._calamine = parsing.CALAMINE_AVAILABLE
+        fd, self.path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(fd)
+        _write_statement(self.path)
+
+    def tearDown(self):
+        self.parsing.CALAMINE_AVAILABLE = self._calamine
+        os.remove(self.path)
+
+    def _parse(self, use_calamine):
+        self.parsing.CALAMINE_AVAILABLE = use_calamine
+        return self.parsing.ExcelBankStatementParser().parse(self.path)
+
+    def test_calamine_and_pandas_give_identical_transactions(self):
+        via_calamine = self._parse(True)
+        via_pandas = self._parse(False)
+        self.assertEqual(via_calamine, via_pandas)
+        self.assertEqual([tx.date for tx in via_pandas], ["2025-11-03", "2025-11-04", "2025-11-04"])
+        numeric = via_pandas[2]
+        self.assertEqual((numeric.payer, numeric.details, numeric.amount), ("304615435", "3279", 12.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
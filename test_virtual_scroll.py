@@ -15,22 +15,19 @@ def test_virtual_scrolling():
     print("\n1. Creating test database with 5000 transactions...")
     db = DatabaseManager("test_viewport")
     
-    # Insert 5000 test transactions
-    test_txs = {}
-    for i in range(5000):
-        key = f"tx{i}"
-        test_txs[key] = {
-            'key': key,
-            'date': f'2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}',
-            'price': 100.00 + i,
-            'name': f'Person {i % 100}',  # 100 unique names
-            'iban': f'LT{i:010d}',
-            'comment': f'Test transaction {i}',
-            'name_norm': f'person {i % 100}',
-            'row_no': i
-        }
-    
-    db.bulk_insert_transactions(test_txs)
+    # Insert 5000 test transactions, streamed as row tuples:
+    # (key, date, price, name, iban, comment, name_norm, row_no)
+    db.bulk_insert_rows(
+        (f"tx{i}",
+         f'2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}',
+         100.00 + i,
+         f'Person {i % 100}',  # 100 unique names
+         f'LT{i:010d}',
+         f'Test transaction {i}',
+         f'person {i % 100}',
+         i)
+        for i in range(5000)
+    )
     print("✅ Inserted 5000 transactions")
     
     # Test 1: Search without limit (old behavior - would return all 5000)
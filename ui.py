@@ -5,12 +5,19 @@ from tkinter import ttk
 import os, json
 from pathlib import Path
 import tkinter.font as tkfont
-from user_data import load_notes, save_notes, user_data_dir
+from user_data import load_notes, save_notes, append_notes, user_data_dir
 import subprocess, platform
-import time
+import threading
 # Platform detection for Windows-specific fixes
 IS_WINDOWS = platform.system() == "Windows"
 
+# Off-screen note editors are recycled instead of kept per row; beyond this many spares they are destroyed
+NOTE_EDITOR_POOL_MAX = 64
+# Note editors are repositioned at most once per frame while scrolling
+PLACE_INTERVAL_MS = 16
+# Bindtag carrying the shared event handlers of those editors
+_NOTE_EDITOR_BINDTAG = "NoteEditor"
+
 from color_config import ColorConfig
 
 # Show "Open Data/Logs" only in dev or when explicitly enabled
@@ -21,28 +28,42 @@ def _support_tools_enabled() -> bool:
 
 #----------------------------------------------------------------------------------------------------------------------------------------------
 
+# Placeholder entries share one pair of class-level handlers via this bindtag
+_PH_BINDTAG = "Placeholder"
+
+def _ph_focus_in(event):
+    entry = event.widget
+    if getattr(entry, "_ph_active", False):
+        entry.delete(0, "end"); entry.config(fg="black"); entry._ph_active = False
+
+def _ph_focus_out(event):
+    entry = event.widget
+    if hasattr(entry, "_ph_text") and not entry.get():
+        entry.insert(0, entry._ph_text); entry.config(fg="#888888"); entry._ph_active = True
+
 def add_placeholder(entry: tk.Entry, text: str):
     entry._ph_text = text
     entry._ph_active = True
     entry.insert(0, text)
     entry.config(fg="#888888")
-    def on_focus_in(_):
-        if entry._ph_active:
-            entry.delete(0, "end"); entry.config(fg="black"); entry._ph_active = False
-    def on_focus_out(_):
-        if not entry.get():
-            entry.insert(0, entry._ph_text); entry.config(fg="#888888"); entry._ph_active = True
-    entry.bind("<FocusIn>", on_focus_in); entry.bind("<FocusOut>", on_focus_out)
+    # bind_class just replaces the same two bindings if they are already installed
+    entry.bind_class(_PH_BINDTAG, "<FocusIn>", _ph_focus_in)
+    entry.bind_class(_PH_BINDTAG, "<FocusOut>", _ph_focus_out)
+    tags = list(entry.bindtags())
+    if _PH_BINDTAG not in tags:
+        tags.insert(1, _PH_BINDTAG)  # right after the widget's own tag, as the old per-widget binds ran
+        entry.bindtags(tuple(tags))
+
+# One notch of a classic wheel; smaller (precision/trackpad) deltas still scroll one unit
+_WHEEL_UNIT = 120
 
 def _wheel_steps(event) -> int:
-    try:
-        d = int(getattr(event, "delta", 0))
-    except Exception:
-        d = 0
-    if d == 0:
+    # Runs on every wheel event. tkinter always sets event.delta as an int
+    # (0 when Tk sent none), so no getattr/int()/try is needed here.
+    d = event.delta
+    if not d:
         return 0
-    unit = 120
-    return int(d / unit) if abs(d) >= unit else (1 if d > 0 else -1)
+    return int(d / _WHEEL_UNIT) if abs(d) >= _WHEEL_UNIT else (1 if d > 0 else -1)
 
 def attach_mousewheel(widget):
     # macOS manages scrolling natively and smoothly. 
@@ -113,12 +134,14 @@ class App(tk.Tk):
         self.lift()
         self.focus_force()
         
-        self._note_store_path = str(user_data_dir() / "notes_store.json")
+        self._note_store_path = str(user_data_dir() / "notes_store.pkl")
         self._note_store = load_notes() or {}
+        self._note_dirty_keys = set()  # keys edited since the last flush to the notes journal
+        self._note_edited_keys = set()  # keys edited locally since the Firebase notes fetch started
         self._save_after_id = None
         self._interact_after_id = None
         self._firebase_save_after_id = None
-        self._last_firebase_save = 0  
+        self._firebase_save_iid = None  # row whose write is waiting on _firebase_save_after_id
         self.firebase_sync = None
         self.after(1000, self._load_firebase_notes)
 
@@ -132,6 +155,7 @@ class App(tk.Tk):
         self._sel_default_bg = ColorConfig.SEL_DEFAULT
         self._sel_default_fg = ColorConfig.SEL_FG_DEFAULT
         self.style.map("Treeview", background=[('selected', ColorConfig.SEL_DEFAULT)], foreground=[('selected', ColorConfig.SEL_FG_DEFAULT)])
+        self._sel_colors = (ColorConfig.SEL_DEFAULT, ColorConfig.SEL_FG_DEFAULT)  # last applied, see app.update_selection_style
         
         # --- NEW: Border for selection (using focus ring) ---
         # self.style.configure("Treeview.Item", borderwidth=2, relief="solid") # Doesn't work well on Mac
@@ -164,8 +188,8 @@ class App(tk.Tk):
             })]
         )
         
-        # Configure focus color to be Black for selection
-        self.style.map("Treeview", focuscolor=[('selected', 'black'), ('!selected', 'white')])
+        # Configure focus color to be Black for selection (set once here, never changes)
+        self.style.map("Treeview", focuscolor=[('selected', ColorConfig.BORDER_FOCUS), ('!selected', 'white')])
 
         # ===== Top bar =====
         top = tk.Frame(self, bg='white'); top.pack(fill='x', padx=10, pady=10)
@@ -210,6 +234,8 @@ class App(tk.Tk):
         self.btn_help = tk.Button(right_top, text='Pagalba', bg='#f3f3f3', relief='raised', bd=1, highlightthickness=0)
         self.btn_help.pack(side='left', padx=(8,0))
         self._help_dropdown = tk.Menu(self, tearoff=0)
+        self._help_menu_dirty = True  # dropdown mirrors help_menu; rebuilt only when this is set
+        self._help_menu_end = None
         self.btn_help.configure(command=lambda: self._show_help_dropdown_at(self.btn_help))
         # --- END OF MODIFICATION ---
 
@@ -253,15 +279,15 @@ class App(tk.Tk):
         self.tbl.column('note', width=200, anchor='w')
         self.tbl.grid(row=0, column=0, sticky='nsew')
 
+        # Scrolling fires these many times per second; the overlay is repositioned
+        # at most once per frame through _schedule_place (see below)
         def _yview_wrapper(*args):
             self.tbl.yview(*args)
-            self.tbl.update_idletasks()
-            self._place_note_editors_now()
+            self._schedule_place()
         
         def _xview_wrapper(*args):
             self.tbl.xview(*args)
-            self.tbl.update_idletasks()
-            self._place_note_editors_now()
+            self._schedule_place()
         
         self._ysb = tk.Scrollbar(mid, orient='vertical', command=_yview_wrapper)
         self._ysb.grid(row=0, column=1, sticky='ns')
@@ -270,30 +296,38 @@ class App(tk.Tk):
 
         def _yset_wrapper(*args):
             self._ysb.set(*args)
-            self._place_note_editors_now()
+            self._schedule_place()
         
         def _xset_wrapper(*args):
             self._xsb.set(*args)
-            self._place_note_editors_now()
+            self._schedule_place()
         
         self.tbl.configure(yscrollcommand=_yset_wrapper, xscrollcommand=_xset_wrapper)
 
-        self._note_widgets = {}
+        self._note_widgets = {}      # iid -> editor, only for rows currently on screen
+        self._note_editor_pool = []  # spare editors, reused as rows scroll into view
+        self._install_note_editor_bindings()
         self._note_save_after_id = None
+        self._place_after_id = None
+        self._place_pending = False  # a trigger arrived while the throttle window was open
+        self._placing = False
+        self._geom_cache = None  # (rx, ry) of the tree inside the overlay parent
         self._note_col_id = None
         
         self.tbl.bind("<<TreeviewSelect>>", lambda e: self._on_row_interact(), add="+")
+        # The tree only moves inside the overlay parent when it is re-laid out
+        self.tbl.bind("<Configure>", self._invalidate_geom_cache, add="+")
 
         def _on_mousewheel(e):
-            self.after(1, self._place_note_editors_now)
+            self._schedule_place()
         self.tbl.bind("<MouseWheel>", _on_mousewheel, add="+")
         
         def _on_key_nav(e):
             if e.keysym in ("Up","Down","Prior","Next","Home","End"):
                 self._on_row_interact()
-                self.after(1, self._place_note_editors_now)
+                self._schedule_place()
         self.tbl.bind("<KeyRelease>", _on_key_nav, add="+")
-        self.after(200, self._place_note_editors_now)
+        self.after(200, self._schedule_place)
 
         # ===== Bottom area (split into two boxes) =====
         bottom = tk.Frame(self, bg='white'); bottom.pack(fill='x', padx=10, pady=(0,10))
@@ -371,7 +405,7 @@ class App(tk.Tk):
     def _do_row_interact(self):
         try:
             self._refresh_bottom_from_selection()
-            self._place_note_editors_now()
+            self._schedule_place()
         except: pass
 
     def _on_bottom_note_changed(self, _event=None):
@@ -381,18 +415,22 @@ class App(tk.Tk):
             iid = sel[0]
             text = self.txt_note.get('1.0', 'end-1c')
 
+            key = iid  # row keys are the tree iids
+            if not hasattr(self, '_note_store'): self._note_store = {}
+            # Arrows, modifiers etc. also fire <KeyRelease>; nothing to sync or save then
+            if self._note_store.get(key, '') == text: return
+
             if hasattr(self, '_note_widgets'):
                 editor = self._note_widgets.get(iid)
                 if editor:
                     try:
-                        editor.delete('1.0', 'end')
-                        editor.insert('1.0', text)
+                        self._sync_editor_text(editor, text)
                         self._set_note_entry_bg(editor)
                     except: pass
 
-            key = self._make_row_key(iid) or str(iid)
-            if not hasattr(self, '_note_store'): self._note_store = {}
             self._note_store[key] = text
+            self._note_dirty_keys.add(key)
+            self._note_edited_keys.add(key)
 
             if getattr(self, "_save_after_id", None):
                 try: self.after_cancel(self._save_after_id)
@@ -401,6 +439,25 @@ class App(tk.Tk):
 
         except Exception: pass
 
+    def _sync_editor_text(self, editor, text):
+        # Rewrite only the span between the common prefix and suffix, so typing one
+        # character sends one character to Tk instead of the whole note
+        old = editor.get('1.0', 'end-1c')
+        if old == text: return
+        # Tk (Tcl 8.6) counts a character above U+FFFF (e.g. an emoji) as two index
+        # units, so code-point offsets would land in the wrong place; replace it all
+        if any(ord(c) > 0xFFFF for c in old) or any(ord(c) > 0xFFFF for c in text):
+            editor.delete('1.0', 'end')
+            editor.insert('1.0', text)
+            return
+        n = min(len(old), len(text))
+        p = 0
+        while p < n and old[p] == text[p]: p += 1
+        q = 0
+        while q < n - p and old[-1 - q] == text[-1 - q]: q += 1
+        editor.delete(f'1.0 + {p} chars', f'1.0 + {len(old) - q} chars')
+        editor.insert(f'1.0 + {p} chars', text[p:len(text) - q])
+
     def _apply_bottom_text_insets(self, left_px=12, right_px=8, vpad_px=4):
         for w in (self.txt_stmt, self.txt_note):
             try: w.configure(padx=left_px, pady=vpad_px)
@@ -429,12 +486,9 @@ class App(tk.Tk):
             
             note = ''
             try:
-                if hasattr(self, '_note_widgets'):
-                    w = self._note_widgets.get(iid)
-                    if w: note = w.get('1.0', 'end-1c')
-                    else:
-                        key = self._make_row_key(iid)
-                        note = self._note_store.get(key, '') or ''
+                # _note_store is kept in step with the row editors on every edit,
+                # so it answers without a Tk round-trip to the editor
+                note = self._note_store.get(iid, '') or ''
             except: pass
             self.set_note_view(note)
         except: pass
@@ -458,11 +512,19 @@ class App(tk.Tk):
             try: self._help_dropdown.grab_release()
             except Exception: pass
     
+    def _mark_help_dirty(self):
+        # Call after changing self.help_menu so the next dropdown picks it up
+        self._help_menu_dirty = True
+
     def _rebuild_help_dropdown(self):
         try:
+            end = self.help_menu.index('end')
+            # Entries added without _mark_help_dirty() still show up via the count check
+            if not self._help_menu_dirty and end == self._help_menu_end: return
+            self._help_menu_dirty = False
+            self._help_menu_end = end
             m = self._help_dropdown
             m.delete(0, 'end')
-            end = self.help_menu.index('end')
             if end is None:
                 m.add_command(label="(No items)", state='disabled')
                 return
@@ -485,24 +547,88 @@ class App(tk.Tk):
         except Exception: return {}
         
     def _load_firebase_notes(self):
+        # The fetch is a network round-trip; run it off the Tk thread and hand
+        # the result back with after(0), like app.load_and_render_async does
+        fb = getattr(self, 'firebase_sync', None)
         try:
-            if self.firebase_sync and self.firebase_sync.is_connected():
-                firebase_notes = self.firebase_sync.get_all_notes()
-                if firebase_notes: self._note_store.update(firebase_notes)
-        except Exception: pass
+            if not (fb and fb.is_connected()): return
+        except Exception: return
+        self._note_edited_keys = set()
+
+        def _fetch():
+            try: firebase_notes = fb.get_all_notes()
+            except Exception: return
+            if firebase_notes: self.after(0, lambda: self._merge_firebase_notes(firebase_notes))
 
-    def _make_row_key(self, iid): return iid
+        threading.Thread(target=_fetch, daemon=True).start()
+
+    def _merge_firebase_notes(self, firebase_notes):
+        try:
+            try: focused = self.focus_get()
+            except Exception: focused = None  # focus_get can raise while a menu holds focus
+            # The fetched values are older than any local edit made while the fetch
+            # was in flight, or still waiting to be journaled or sent; keep those
+            local = self._note_edited_keys | self._note_dirty_keys
+            if self._firebase_save_iid is not None: local.add(self._firebase_save_iid)
+            # ...and the row being typed in, from its editor or the bottom note pane
+            if getattr(focused, '_iid', None) is not None: local.add(focused._iid)
+            if focused is self.txt_note: local.update(self.tbl.selection()[:1])
+            changed = {k: v for k, v in firebase_notes.items()
+                       if k not in local and self._note_store.get(k) != v}
+            if not changed: return
+            self._note_store.update(changed)
+            self._note_dirty_keys.update(changed)  # journal only what actually changed
+            # Show the fetched notes in the editors already on screen
+            for iid, editor in self._note_widgets.items():
+                if iid in changed:
+                    self._sync_editor_text(editor, changed[iid] or '')
+                    self._set_note_entry_bg(editor)
+            self._refresh_bottom_from_selection()
+        except Exception: pass
 
     def _set_note_entry_bg(self, widget):
         try:
             txt = widget.get('1.0', 'end-1c') if isinstance(widget, tk.Text) else widget.get()
         except: txt = ''
         has_text = bool((txt or '').strip())
+        # Called on every keystroke; only reconfigure when the colour actually flips
+        if getattr(widget, '_bg_has_text', None) == has_text: return
         bg = '#FFD6D6' if has_text else '#FFFFFF'
-        try: widget.configure(bg=bg, insertbackground='black')
+        try:
+            widget.configure(bg=bg, insertbackground='black')
+            widget._bg_has_text = has_text
         except: pass
 
+    def _invalidate_geom_cache(self, _event=None):
+        self._geom_cache = None
+
+    def _schedule_place(self):
+        # Leading + trailing throttle (~60 Hz): the first trigger of a burst places
+        # right away; anything arriving within the next PLACE_INTERVAL_MS is folded
+        # into a single trailing pass, which sees the final scroll position.
+        if getattr(self, "_place_after_id", None):
+            self._place_pending = True
+            return
+        # Arm the window before running, so triggers raised during this pass
+        # (scroll callbacks, the re-entrancy guard) become the trailing pass
+        self._place_after_id = self.after(PLACE_INTERVAL_MS, self._do_place)
+        self._place_note_editors_now()
+
+    def _do_place(self):
+        self._place_after_id = None
+        if not getattr(self, "_place_pending", False): return
+        self._place_pending = False
+        # Keep the window open while the burst continues
+        self._place_after_id = self.after(PLACE_INTERVAL_MS, self._do_place)
+        self._place_note_editors_now()
+
     def _place_note_editors_now(self):
+        # Never run two passes at once; a request that arrives mid-pass is
+        # queued as one trailing pass instead
+        if getattr(self, "_placing", False):
+            self._schedule_place()
+            return
+        self._placing = True
         try:
             tree = self.tbl
             if not tree.winfo_ismapped(): return
@@ -517,65 +643,59 @@ class App(tk.Tk):
             if not hasattr(self, "_note_widgets"): self._note_widgets = {}
             parent = self._overlay_parent
             
-            # --- 2. ROBUST VISIBILITY DETECTION (Contiguous Iterator) ---
-            # Instead of probing pixels (which can miss rows), we find the top item
-            # and walk down the tree using tree.next() until we go off-screen.
-            visible_iids = set()
+            # --- 2. VIEWPORT-BOUNDED VISIBILITY DETECTION ---
+            # Find the top visible row by pixel, then walk tree.next() only until we
+            # fall off the bottom: one bbox() probe per visible row, and the full
+            # children list (every row in the table) is never materialized.
+            # The bbox is kept so step 4 doesn't have to ask Tk for it again.
+            visible_iids = {}
+            tree_height = tree.winfo_height()
             
-            # Find the first visible item at the top
             # Check a range of points at the top to be robust against headers/partial scroll
-            start_iid = None
+            curr = None
             for y_probe in range(1, 100, 5):
-                start_iid = tree.identify_row(y_probe)
-                if start_iid: break
+                curr = tree.identify_row(y_probe)
+                if curr: break
             
-            if start_iid:
-                curr = start_iid
-                tree_height = tree.winfo_height()
-                
-                # Safety break to prevent infinite loops if tree state is corrupted
-                max_loops = 200 
-                loop_count = 0
-                
-                while curr and loop_count < max_loops:
-                    # Check if this item is actually visible
-                    bbox = tree.bbox(curr, self._note_col_id)
-                    if not bbox:
-                        pass
-                    else:
-                        _x, y, _w, h = bbox
-                        if y > tree_height: break # maximizing efficiency: stop once we leave screen
-                        visible_iids.add(curr)
-                    
-                    curr = tree.next(curr)
-                    loop_count += 1
+            max_rows = 200  # safety bound if tree state is inconsistent
+            while curr and len(visible_iids) < max_rows:
+                bbox = tree.bbox(curr, self._note_col_id)
+                if not bbox or bbox[1] > tree_height: break # stop once we leave screen
+                visible_iids[curr] = bbox
+                curr = tree.next(curr)
             
             # --- SAFETY CHECK: If we found NO visible rows, something went wrong with detection.
             # DO NOT clear widgets, just abort this update to prevent "flashing" empty.
             if not visible_iids:
                 return
 
-            # --- 3. Hide non-visible widgets (Cleanup) ---
+            # --- 3. Hide non-visible widgets and hand them back to the pool ---
+            # The editor with keyboard focus is only hidden and stays bound to its
+            # row: recycled, the user's next keystrokes would land in another row's note.
+            try: focused = self.focus_get()
+            except Exception: focused = None  # focus_get can raise while a menu holds focus
             for iid in list(self._note_widgets.keys()):
                 if iid not in visible_iids:
-                    try: self._note_widgets[iid].place_forget()
-                    except: pass
+                    editor = self._note_widgets[iid]
+                    if editor is focused:
+                        try: editor.place_forget()
+                        except: pass
+                        continue
+                    self._release_note_editor(self._note_widgets.pop(iid))
             
             # --- 4. Place visible widgets ---
-            try:
-                rx = tree.winfo_rootx() - parent.winfo_rootx()
-                ry = tree.winfo_rooty() - parent.winfo_rooty()
-            except: rx = ry = 0
+            if self._geom_cache is None:
+                try:
+                    self._geom_cache = (tree.winfo_rootx() - parent.winfo_rootx(),
+                                        tree.winfo_rooty() - parent.winfo_rooty())
+                except: pass
+            rx, ry = self._geom_cache or (0, 0)
             
-            for iid in visible_iids:
+            for iid, bbox in visible_iids.items():
                 try:
-                    bbox = tree.bbox(iid, self._note_col_id)
-                    if not bbox: continue
-                    
                     x, y, w, h = bbox
                     
                     # Vertical Clipping: Ensure widget doesn't extend past the bottom
-                    tree_height = tree.winfo_height()
                     if y + h > tree_height:
                         h = tree_height - y
                     
@@ -585,7 +705,7 @@ class App(tk.Tk):
                     
                     editor = self._note_widgets.get(iid)
                     if editor is None:
-                        editor = self._make_note_entry(iid)
+                        editor = self._acquire_note_editor(iid)
                         self._note_widgets[iid] = editor
                     
                     pad_x, pad_y, y_offset = (4, 1, 1) if IS_WINDOWS else (4, 3, 0)
@@ -599,6 +719,29 @@ class App(tk.Tk):
                     editor.lift()
                 except: pass
         except: pass
+        finally: self._placing = False
+
+    def _acquire_note_editor(self, iid):
+        # Reuse a spare editor when there is one, otherwise build a new one
+        pool = getattr(self, "_note_editor_pool", None)
+        if not pool: return self._make_note_entry(iid)
+        e = pool.pop()
+        e._iid = iid
+        e.delete('1.0', 'end')
+        init = (self._note_store.get(iid, "") if hasattr(self, "_note_store") else "") or ""
+        if init: e.insert('1.0', init)
+        self._set_note_entry_bg(e)
+        return e
+
+    def _release_note_editor(self, editor):
+        try: editor.place_forget()
+        except: pass
+        pool = getattr(self, "_note_editor_pool", None)
+        if pool is not None and len(pool) < NOTE_EDITOR_POOL_MAX:
+            pool.append(editor)
+        else:
+            try: editor.destroy()
+            except: pass
 
     def _make_note_entry(self, iid):
         font_config = ('Segoe UI', 10)
@@ -613,51 +756,63 @@ class App(tk.Tk):
             except: pass
         
         try:
-            tags = list(e.bindtags()); tags.remove('Text'); tags.insert(0, 'Text'); e.bindtags(tuple(tags))
+            # Text class bindings first (so typing works), then the shared row-editor handlers
+            tags = list(e.bindtags()); tags.remove('Text'); tags.insert(0, 'Text'); tags.insert(1, _NOTE_EDITOR_BINDTAG); e.bindtags(tuple(tags))
         except: pass
         
-        e.bind('<Key>', lambda ev: 'break', add='+')
-        e.bind('<FocusOut>', lambda ev: e.tag_remove('sel', '1.0', 'end'), add='+')
-        e.bind("<FocusIn>",  lambda ev, _iid=iid: (self.tbl.selection_set(_iid), self.tbl.focus(_iid)), add="+")
-        e.bind("<Button-1>", lambda ev, _iid=iid: (self.tbl.selection_set(_iid), self.tbl.focus(_iid)), add="+")
-        
-        def _block_nav(ev):
-            if ev.keysym.lower() in ("up","down","prior","next","home","end"): return "break"
-        e.bind("<KeyPress>", _block_nav, add="+")
+        # The row this editor belongs to; reassigned when the editor is recycled.
+        # The class-level handlers (_install_note_editor_bindings) read it from event.widget.
+        e._iid = iid
         
         init = (self._note_store.get(iid, "") if hasattr(self, "_note_store") else "") or ""
         if init: e.insert('1.0', init)
         self._set_note_entry_bg(e)
-        
-        def on_change(_ev=None, widget=e):
-            try:
-                txt = widget.get('1.0', 'end-1c')
-                self._set_note_entry_bg(widget)
-                
-                if not hasattr(self, "_note_store"): self._note_store = {}
-                self._note_store[iid] = txt
-                
-                current_time = time.time()
-                if current_time - getattr(self, '_last_firebase_save', 0) > 3:
-                    self.after(100, lambda: self._save_note_to_firebase(iid, txt))
-                    self._last_firebase_save = current_time
-                else:
-                    if getattr(self, "_firebase_save_after_id", None):
-                        try: self.after_cancel(self._firebase_save_after_id)
-                        except: pass
-                    self._firebase_save_after_id = self.after(2000, lambda: self._save_note_to_firebase(iid, txt))
+        return e
 
-                if getattr(self, "_save_after_id", None):
-                    try: self.after_cancel(self._save_after_id)
-                    except: pass
-                self._save_after_id = self.after(500, self._save_note_store)
-                
-                sel = self.tbl.selection()
-                if sel and sel[0] == iid: self.set_note_view(txt)
-            except Exception: pass
+    def _install_note_editor_bindings(self):
+        # One set of handlers for every row editor instead of fresh closures per widget
+        tag = _NOTE_EDITOR_BINDTAG
+        self.bind_class(tag, '<Key>', lambda ev: 'break')
+        self.bind_class(tag, '<FocusOut>', lambda ev: ev.widget.tag_remove('sel', '1.0', 'end'))
+        self.bind_class(tag, '<FocusIn>', self._on_note_editor_focus)
+        self.bind_class(tag, '<Button-1>', self._on_note_editor_focus)
+        self.bind_class(tag, '<KeyRelease>', self._on_note_editor_change)
+
+    def _on_note_editor_focus(self, event):
+        iid = getattr(event.widget, '_iid', None)
+        if iid is None: return
+        try: self.tbl.selection_set(iid); self.tbl.focus(iid)
+        except Exception: pass
 
-        e.bind("<KeyRelease>", on_change, add="+")
-        return e
+    def _on_note_editor_change(self, event):
+        try:
+            widget = event.widget
+            iid = widget._iid
+            txt = widget.get('1.0', 'end-1c')
+            self._set_note_entry_bg(widget)
+            
+            if not hasattr(self, "_note_store"): self._note_store = {}
+            self._note_store[iid] = txt
+            self._note_dirty_keys.add(iid)
+            self._note_edited_keys.add(iid)
+            
+            # Trailing debounce: one Firebase write a second after typing stops
+            if getattr(self, "_firebase_save_after_id", None):
+                try: self.after_cancel(self._firebase_save_after_id)
+                except: pass
+                # Moving on to another row must not swallow the previous row's write
+                if self._firebase_save_iid != iid: self._flush_firebase_note()
+            self._firebase_save_iid = iid
+            self._firebase_save_after_id = self.after(1000, self._flush_firebase_note)
+
+            if getattr(self, "_save_after_id", None):
+                try: self.after_cancel(self._save_after_id)
+                except: pass
+            self._save_after_id = self.after(500, self._save_note_store)
+            
+            sel = self.tbl.selection()
+            if sel and sel[0] == iid: self.set_note_view(txt)
+        except Exception: pass
 
     def set_comment(self, text: str):
         try:
@@ -669,10 +824,27 @@ class App(tk.Tk):
         except Exception: pass
 
     def _save_note_store(self):
-        try: save_notes(self._note_store)
+        # Only the notes edited since the last flush are appended to the journal
+        try:
+            dirty, self._note_dirty_keys = self._note_dirty_keys, set()
+            append_notes({k: self._note_store.get(k, '') for k in dirty}, self._note_store)
         except Exception: pass
         finally: self._save_after_id = None
 
+    def _compact_note_store(self):
+        # Full snapshot (folds in the journal and any unflushed edits); used on exit
+        try:
+            save_notes(self._note_store)
+            self._note_dirty_keys.clear()
+        except Exception: pass
+
+    def _flush_firebase_note(self):
+        # Sends whatever the row holds now, not the text at the time it was scheduled
+        iid, self._firebase_save_iid = self._firebase_save_iid, None
+        self._firebase_save_after_id = None
+        if iid is not None:
+            self._save_note_to_firebase(iid, self._note_store.get(iid, ''))
+
     def _save_note_to_firebase(self, key, txt):
         try:
             if hasattr(self, 'firebase_sync') and self.firebase_sync:
@@ -1,4 +1,4 @@
-import json, os, sys
+import json, os, pickle, sys
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
@@ -20,24 +20,76 @@ def user_data_dir() -> Path:
     return p
 
 # ----- Notes store -----
+# notes_store.pkl is the last full snapshot. Edits in between are appended to
+# notes_store.journal, one JSON object of changed notes per line, so a flush
+# costs the size of the edit instead of the whole store. Loading replays the
+# journal over the snapshot; save_notes() writes a fresh snapshot and empties it.
+# The snapshot is a pickle (much faster to load and dump than JSON for a large
+# dict of strings). Older versions kept it as JSON in notes_store.json; that
+# file is read once when there is no pickle yet and is never written again,
+# so a downgraded version still finds its own notes there.
+NOTES_JOURNAL_MAX_BYTES = 1024 * 1024
+
 def _notes_path() -> Path:
+    return user_data_dir() / "notes_store.pkl"
+
+def _legacy_notes_path() -> Path:
     return user_data_dir() / "notes_store.json"
 
+def _notes_journal_path() -> Path:
+    return user_data_dir() / "notes_store.journal"
+
 def load_notes() -> Dict[str, str]:
-    p = _notes_path()
-    if not p.exists():
-        return {}
+    notes = {}
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        # Decode straight from the file rather than read_bytes() first, so a
+        # large store isn't held in memory twice (raw bytes + the dict)
+        with open(_notes_path(), "rb") as f:
+            notes = pickle.load(f)
+    except FileNotFoundError:
+        try:
+            with open(_legacy_notes_path(), "rb") as f:
+                notes = json.load(f)
+        except Exception:
+            notes = {}
     except Exception:
-        return {}
+        notes = {}
+    torn = False
+    try:
+        with open(_notes_journal_path(), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    notes.update(json.loads(line))
+                except ValueError:
+                    torn = True  # interrupted append
+    except OSError:
+        pass
+    if torn:
+        # Compact now, or the next append would land on the broken line
+        save_notes(notes)
+    return notes
 
 def save_notes(notes: Dict[str, str]) -> None:
     try:
-        _notes_path().write_text(
-            json.dumps(notes or {}, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        p = _notes_path()
+        tmp = p.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps(dict(notes or {}), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, p)
+        # The snapshot now holds everything the journal did
+        _notes_journal_path().unlink(missing_ok=True)
+    except Exception:
+        pass  # never crash UI on IO errors
+
+def append_notes(changes: Dict[str, str], notes: Optional[Dict[str, str]] = None) -> None:
+    """Journal the changed notes; with the full store given, compact once the journal grows large."""
+    if not changes:
+        return
+    try:
+        jp = _notes_journal_path()
+        with open(jp, "a", encoding="utf-8") as f:
+            f.write(json.dumps(changes, ensure_ascii=False) + "\n")
+        if notes is not None and jp.stat().st_size > NOTES_JOURNAL_MAX_BYTES:
+            save_notes(notes)
     except Exception:
         pass  # never crash UI on IO errors
 
@@ -89,6 +141,10 @@ def create_user_config_if_missing(version: str = "") -> None:
             data = json.loads(bundle_cfg.read_text(encoding="utf-8"))
     except Exception:
         data = {}
+    # A config.json made from an older template may still say 'source'; rename
+    # it before the first write so the new config never needs migrating
+    if isinstance(data, dict) and "source" in data:
+        data.setdefault("data_source", data.pop("source"))
     
     # Set first run date (NEW!)
     import datetime
@@ -106,9 +162,25 @@ def read_user_config() -> Dict[str, Any]:
     if not upath.exists():
         create_user_config_if_missing()
     try:
-        return json.loads(upath.read_text(encoding="utf-8"))
+        cfg = json.loads(upath.read_text(encoding="utf-8"))
     except Exception:
         return {}
+    return cfg
+
+def migrate_user_config() -> None:
+    """
+    Bring a user config written by an older version up to date. Called once
+    at startup, so read_user_config() itself never writes.
+    """
+    upath = _user_config_path()
+    try:
+        cfg = json.loads(upath.read_text(encoding="utf-8"))
+    except Exception:
+        return
+    # Older versions named the data source 'source'; keep a single key for it
+    if isinstance(cfg, dict) and "source" in cfg:
+        cfg.setdefault("data_source", cfg.pop("source"))
+        write_user_config(cfg)
 
 def write_user_config(cfg: Dict[str, Any]) -> None:
     try: